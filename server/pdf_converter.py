@@ -9,24 +9,282 @@ import os
 import re
 import sys
 import json
+import logging
 import argparse
+import statistics
+import importlib.util
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, List, Dict, Tuple
 
-# Try docling first
-try:
-    from docling.document_converter import DocumentConverter
-    from docling.datamodel.base_models import InputFormat
-    from docling.datamodel.document import PictureItem
-    DOCLING_AVAILABLE = True
-except ImportError:
-    DOCLING_AVAILABLE = False
-    print("Warning: Docling not available, falling back to PyMuPDF + Tesseract")
+log = logging.getLogger(__name__)
+
+# Try docling first. It is only imported where it is used, since it pulls in
+# torch/transformers, which the fallback path and OCR pool workers never need.
+DOCLING_AVAILABLE = importlib.util.find_spec("docling") is not None
+if not DOCLING_AVAILABLE:
+    log.warning("Docling not available, falling back to PyMuPDF + Tesseract")
 
 # Fallback imports
 import fitz  # PyMuPDF for image extraction
-from PIL import Image
-from io import BytesIO
+
+# Optional fast JSON encoder for metadata output
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Precompiled patterns for markdown cleanup and question detection
+_RE_HSPACE = re.compile(r'[ \t]+')
+_RE_BLANK_LINES = re.compile(r'(\n\s*)+\n')
+_RE_LINE_START = re.compile(
+    r'^(?:(?P<question>\d+)\.\s+'
+    r'|(?P<choice>[A-J])(?P<dot>\.)?\s+'
+    r'|(?P<passage>PASSAGE\s+[IVX]+)'
+    r'|(?P<section>ENGLISH TEST|MATHEMATICS TEST|READING TEST|SCIENCE TEST))',
+    re.MULTILINE
+)
+_RE_QUESTION = re.compile(
+    r'(?:^|\n)\s*\*?\*?(\d+)\.\*?\*?\s+(.+?)(?=\n\s*\*?\*?\d+\.\*?\*?|$)',
+    re.DOTALL
+)
+_RE_PAGE = re.compile(r'(?:## Page|page\s+)(\d+)', re.IGNORECASE)
+# Question number at the start of a single Docling text item, and list markers like "12."
+_RE_ITEM_QUESTION = re.compile(r'\s*\*?\*?(\d+)\.\*?\*?\s+(.*)', re.DOTALL)
+_RE_LIST_MARKER = re.compile(r'\s*(\d+)\.?\s*$')
+
+# Phrases suggesting a question refers to a figure
+_FIGURE_KEYWORDS = (
+    'figure', 'graph', 'diagram', 'shown', 'below', 'above',
+    'image', 'chart', 'table', 'illustration', 'picture',
+    'as shown', 'in the figure', 'following figure', 'refer to',
+    'based on', 'according to'
+)
+# Single-pass, case-insensitive matcher for any figure keyword
+_RE_FIGURE_KEYWORD = re.compile('|'.join(map(re.escape, _FIGURE_KEYWORDS)), re.IGNORECASE)
+
+# Skip Tesseract's inverted-text detection pass (scans are dark text on light paper)
+_TESSERACT_CONFIG = '-c tessedit_do_invert=0'
+
+# OCR resolution: clean scans read fine at the lower DPI; pages whose median
+# word confidence falls below the threshold are re-rendered and read again
+_OCR_DPI = 110
+_OCR_RETRY_DPI = 200
+_OCR_MIN_CONFIDENCE = 70
+
+
+# Per-process PDF handle for OCR pool workers (set by _init_ocr_worker)
+_worker_doc = None
+# Per-process tesserocr API handle, or None to use pytesseract (set by _init_ocr_worker)
+_worker_api = None
+
+
+def _init_ocr_worker(pdf_path: str):
+    """
+    Initialize an OCR pool worker process.
+    Limits Tesseract to a single thread so workers don't oversubscribe cores,
+    and opens the PDF once per worker instead of once per page.
+    When tesserocr is installed, the Tesseract engine is also loaded once here
+    rather than starting the tesseract binary for every page.
+    """
+    global _worker_doc, _worker_api
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    _worker_doc = fitz.open(pdf_path)
+
+    try:
+        import tesserocr
+        _worker_api = tesserocr.PyTessBaseAPI(lang='eng')
+        # Skip Tesseract's inverted-text detection pass (scans are dark text on light paper)
+        _worker_api.SetVariable("tessedit_do_invert", "0")
+    except (ImportError, RuntimeError):
+        # Binding or its language data unavailable; fall back to pytesseract
+        _worker_api = None
+
+
+def _render_gray(page, dpi: int):
+    """
+    Render a page to a grayscale PIL image at the given resolution.
+    """
+    # OCR-only dependency, loaded in the pool workers, never on the Docling path
+    from PIL import Image
+
+    mat = fitz.Matrix(dpi / 72, dpi / 72)
+    # Render in grayscale: Tesseract discards color anyway
+    pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
+    # Wrap the raw samples directly instead of a PNG encode/decode round-trip
+    img = Image.frombytes("L", (pix.width, pix.height), pix.samples)
+    # frombytes copied the samples; free the pixmap before OCR runs
+    pix = None
+    # Keep MuPDF's resource store from growing across the worker's pages
+    fitz.TOOLS.store_shrink(100)
+    return img
+
+
+def _binarize(img):
+    """
+    Threshold a grayscale page image with Otsu's method, so Tesseract receives
+    clean black-and-white input and its own binarization has nothing to do.
+    """
+    hist = img.histogram()
+    total = sum(hist)
+    sum_all = sum(level * count for level, count in enumerate(hist))
+
+    # Pick the threshold that maximizes between-class variance
+    sum_dark = 0
+    weight_dark = 0
+    best_variance = -1.0
+    threshold = 0
+    for level, count in enumerate(hist):
+        weight_dark += count
+        if weight_dark == 0:
+            continue
+        weight_light = total - weight_dark
+        if weight_light == 0:
+            break
+        sum_dark += level * count
+        mean_dark = sum_dark / weight_dark
+        mean_light = (sum_all - sum_dark) / weight_light
+        variance = weight_dark * weight_light * (mean_dark - mean_light) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            threshold = level
+
+    # Single lookup-table pass in C
+    return img.point([0 if level <= threshold else 255 for level in range(256)])
+
+
+def _ocr_image(img) -> Tuple[str, Optional[float]]:
+    """
+    Run Tesseract on a page image.
+
+    Returns:
+        Tuple of (text, median word confidence), confidence None when no words were found
+    """
+    if _worker_api is not None:
+        _worker_api.SetImage(img)
+        text = _worker_api.GetUTF8Text()
+        confidences = _worker_api.AllWordConfidences()
+    else:
+        from pytesseract import pytesseract
+
+        # One tesseract run writes both the plain text and the per-word TSV
+        with pytesseract.save(img) as (output_base, input_filename):
+            pytesseract.run_tesseract(
+                input_filename, output_base, extension='txt', lang='eng',
+                config=f'{_TESSERACT_CONFIG} -c tessedit_create_tsv=1'
+            )
+            with open(f"{output_base}.txt", encoding="utf-8") as f:
+                text = f.read()
+            with open(f"{output_base}.tsv", encoding="utf-8") as f:
+                tsv = f.read()
+
+        confidences = []
+        for row in tsv.splitlines()[1:]:
+            fields = row.split('\t')
+            # Word rows carry text in the last column; layout rows have conf -1
+            if len(fields) == 12 and fields[11].strip() and float(fields[10]) >= 0:
+                confidences.append(float(fields[10]))
+
+    return text, statistics.median(confidences) if confidences else None
+
+
+def _ocr_page(page_num: int) -> Tuple[int, str]:
+    """
+    OCR a single scanned page inside an OCR pool worker.
+    Reads the page at a low resolution first and only re-renders at a higher
+    one when Tesseract isn't confident about the result.
+
+    Args:
+        page_num: 0-indexed page number
+
+    Returns:
+        Tuple of (page_num, page_text)
+    """
+    try:
+        page = _worker_doc[page_num]
+
+        text, confidence = _ocr_image(_binarize(_render_gray(page, _OCR_DPI)))
+        # Blank or figure-only pages have no words and gain nothing from a retry
+        if confidence is not None and confidence < _OCR_MIN_CONFIDENCE:
+            # Small or faint print: read the page again with more pixels
+            text, _ = _ocr_image(_binarize(_render_gray(page, _OCR_RETRY_DPI)))
+    except Exception as e:
+        # Some pytesseract errors (e.g. TesseractNotFoundError) can't be unpickled
+        # in the parent and would break the pool; send back a plain message instead
+        raise RuntimeError(f"OCR failed on page {page_num + 1}: {e}") from None
+
+    return page_num, text
+
+
+def _write_bytes(path: Path, data: bytes):
+    """
+    Write an already-encoded file in one go with raw os-level calls,
+    bypassing Python's buffered io layer.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=None)
+def _get_docling_converter(do_ocr: bool, do_table_structure: bool, table_mode: str):
+    """
+    Return a Docling converter for the given pipeline options, creating it on first use.
+    Docling loads its layout and table models on construction, so converters are
+    cached per option set and shared by every conversion in the process.
+
+    Args:
+        do_ocr: Whether Docling should run OCR on page images
+        do_table_structure: Whether to run TableFormer table structure recognition
+        table_mode: TableFormer mode ("fast" or "accurate")
+    """
+    from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import (
+        AcceleratorOptions,
+        PdfPipelineOptions,
+        TableFormerMode,
+        TableStructureOptions,
+    )
+
+    pipeline_kwargs = {}
+    # Give the layout/table models half the cores on larger machines, never
+    # fewer than Docling's default of 4; an explicit thread setting wins
+    if "DOCLING_NUM_THREADS" not in os.environ and "OMP_NUM_THREADS" not in os.environ:
+        pipeline_kwargs["accelerator_options"] = AcceleratorOptions(
+            num_threads=max(4, (os.cpu_count() or 1) // 2),
+        )
+
+    pipeline_options = PdfPipelineOptions(
+        **pipeline_kwargs,
+        do_ocr=do_ocr,
+        do_table_structure=do_table_structure,
+        table_structure_options=TableStructureOptions(
+            mode=TableFormerMode(table_mode),
+            do_cell_matching=True,
+        ),
+    )
+
+    return DocumentConverter(
+        allowed_formats=[InputFormat.PDF],
+        format_options={
+            # pypdfium2 parses text and page geometry faster than docling-parse
+            InputFormat.PDF: PdfFormatOption(
+                backend=PyPdfiumDocumentBackend,
+                pipeline_options=pipeline_options,
+            )
+        },
+    )
 
 
 class PDFToMarkdownConverter:
@@ -35,7 +293,8 @@ class PDFToMarkdownConverter:
     and figure detection. Uses PyMuPDF to crop detected figures from pages.
     """
 
-    def __init__(self, pdf_path: str, output_dir: str = "output", use_ocr: bool = True):
+    def __init__(self, pdf_path: str, output_dir: str = "output", use_ocr: bool = True,
+                 extract_tables: bool = True):
         """
         Initialize the converter.
 
@@ -43,11 +302,13 @@ class PDFToMarkdownConverter:
             pdf_path: Path to the input PDF file
             output_dir: Directory for output files
             use_ocr: Whether to use OCR for scanned documents
+            extract_tables: Whether Docling should recognize table structure
         """
         self.pdf_path = Path(pdf_path)
         self.output_dir = Path(output_dir)
         self.images_dir = self.output_dir / "images"
         self.use_ocr = use_ocr
+        self.extract_tables = extract_tables
 
         # Create output directories
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -61,13 +322,37 @@ class PDFToMarkdownConverter:
         # Store Docling result for figure extraction
         self.docling_result = None
 
+        # Shared PyMuPDF handle, opened lazily and reused by every extraction path
+        self._doc = None
+
+    def _get_doc(self) -> fitz.Document:
+        """
+        Return the shared PyMuPDF document, opening it on first use.
+        """
+        if self._doc is None:
+            self._doc = fitz.open(self.pdf_path)
+        return self._doc
+
+    def _close_doc(self):
+        """
+        Close the shared PyMuPDF document if it is open.
+        """
+        if self._doc is not None:
+            self._doc.close()
+            self._doc = None
+            # Free whatever MuPDF still caches for the closed document
+            fitz.TOOLS.store_shrink(100)
+
     def extract_figures_from_docling(self, docling_result) -> List[Dict]:
         """
         Extract individual figures detected by Docling's layout analysis.
         Uses bounding boxes from Docling to crop figures from PDF pages.
         """
+        import numpy as np
+        from docling.datamodel.document import PictureItem
+
         figures = []
-        doc = fitz.open(self.pdf_path)
+        doc = self._get_doc()
         self.total_pages = len(doc)
 
         # Get pictures from Docling's document structure
@@ -78,14 +363,18 @@ class PDFToMarkdownConverter:
             if isinstance(item, PictureItem):
                 picture_items.append(item)
 
-        print(f"Docling detected {len(picture_items)} figures in the document")
+        log.info("Docling detected %d figures in the document", len(picture_items))
+
+        # Gather page and bounding box for every picture that can be located
+        candidates = []  # (idx, page_num) per locatable picture
+        bbox_rows = []   # (l, t, r, b, page_width, page_height) per locatable picture
+        pages = {}       # page_num -> loaded page, reused for every figure on it
 
-        # Process each detected picture
         for idx, picture in enumerate(picture_items):
             try:
                 # Get provenance info (page and bounding box)
                 if not picture.prov or len(picture.prov) == 0:
-                    print(f"  Figure {idx + 1}: No provenance info")
+                    log.debug("  Figure %d: No provenance info", idx + 1)
                     continue
 
                 prov = picture.prov[0]  # First provenance entry
@@ -93,72 +382,93 @@ class PDFToMarkdownConverter:
                 bbox = prov.bbox
 
                 if page_num < 1 or page_num > len(doc):
-                    print(f"  Figure {idx + 1}: Invalid page number {page_num}")
+                    log.debug("  Figure %d: Invalid page number %d", idx + 1, page_num)
                     continue
 
                 # Get the PDF page (0-indexed in PyMuPDF)
-                page = doc[page_num - 1]
-                page_rect = page.rect
-
-                # Get the bbox coordinates from Docling
-                # Docling uses PDF coordinate system: origin at BOTTOM-left, y increases upward
-                # bbox has l=left, t=top, r=right, b=bottom (in PDF coords where top > bottom)
-                # PyMuPDF uses origin at TOP-left, y increases downward
-
-                docling_l = bbox.l
-                docling_t = bbox.t  # In PDF coords, this is the higher y value
-                docling_r = bbox.r
-                docling_b = bbox.b  # In PDF coords, this is the lower y value
-
-                print(f"  Figure {idx + 1} on page {page_num}: docling_bbox=({docling_l:.1f}, {docling_b:.1f}, {docling_r:.1f}, {docling_t:.1f}), page_size=({page_rect.width:.1f}, {page_rect.height:.1f})")
-
-                # Convert from PDF coordinates (bottom-left origin) to PyMuPDF (top-left origin)
-                # PyMuPDF y = page_height - PDF y
-                x0 = docling_l
-                x1 = docling_r
-                y0 = page_rect.height - docling_t  # top in PDF becomes smaller y in PyMuPDF
-                y1 = page_rect.height - docling_b  # bottom in PDF becomes larger y in PyMuPDF
-
-                print(f"    Converted to PyMuPDF coords: ({x0:.1f}, {y0:.1f}, {x1:.1f}, {y1:.1f})")
-
-                # Create clip rectangle with some padding
-                padding = 5
-                clip_rect = fitz.Rect(
-                    max(0, x0 - padding),
-                    max(0, y0 - padding),
-                    min(page_rect.width, x1 + padding),
-                    min(page_rect.height, y1 + padding)
-                )
+                if page_num not in pages:
+                    pages[page_num] = doc[page_num - 1]
+                page_rect = pages[page_num].rect
 
-                # Skip if rect is too small (less than 30x30 points)
-                if clip_rect.width < 30 or clip_rect.height < 30:
-                    print(f"    Skipping: rect too small ({clip_rect.width:.1f}x{clip_rect.height:.1f})")
-                    continue
+                row = (bbox.l, bbox.t, bbox.r, bbox.b, page_rect.width, page_rect.height)
+                candidates.append((idx, page_num))
+                bbox_rows.append(row)
 
-                # Skip page headers: figures at very top of page with extreme aspect ratio
-                aspect_ratio = clip_rect.width / max(clip_rect.height, 1)
-                if y0 < 80 and aspect_ratio > 5:
-                    print(f"    Skipping: likely page header (y0={y0:.1f}, aspect_ratio={aspect_ratio:.1f})")
-                    continue
+            except Exception as e:
+                log.warning("Could not extract figure %d: %s", idx + 1, e, exc_info=True)
+
+        if candidates:
+            # Docling uses PDF coordinate system: origin at BOTTOM-left, y increases upward
+            # bbox has l=left, t=top, r=right, b=bottom (in PDF coords where top > bottom)
+            # PyMuPDF uses origin at TOP-left, y increases downward
+            # All boxes are converted and filtered in one vectorized pass.
+            docling_l, docling_t, docling_r, docling_b, page_w, page_h = np.array(bbox_rows, dtype=float).T
+
+            # Convert from PDF coordinates (bottom-left origin) to PyMuPDF (top-left origin)
+            # PyMuPDF y = page_height - PDF y
+            x0 = docling_l
+            x1 = docling_r
+            y0 = page_h - docling_t  # top in PDF becomes smaller y in PyMuPDF
+            y1 = page_h - docling_b  # bottom in PDF becomes larger y in PyMuPDF
+
+            # Clip rectangles with some padding, clamped to the page
+            padding = 5
+            clip_x0 = np.maximum(0, x0 - padding)
+            clip_y0 = np.maximum(0, y0 - padding)
+            clip_x1 = np.minimum(page_w, x1 + padding)
+            clip_y1 = np.minimum(page_h, y1 + padding)
+            clip_w = clip_x1 - clip_x0
+            clip_h = clip_y1 - clip_y0
+
+            # Skip if rect is too small (less than 30x30 points)
+            too_small = (clip_w < 30) | (clip_h < 30)
+            # Skip page headers: figures at very top of page with extreme aspect ratio
+            aspect_ratio = clip_w / np.maximum(clip_h, 1)
+            page_header = ~too_small & (y0 < 80) & (aspect_ratio > 5)
+
+            if too_small.any() or page_header.any():
+                log.debug("  Skipping %d figures too small and %d likely page headers",
+                          too_small.sum(), page_header.sum())
+            keep = np.flatnonzero(~(too_small | page_header))
+        else:
+            keep = []
+
+        # Render only the surviving figures
+        rendered_page = None
+        for i in keep:
+            idx, page_num = candidates[i]
+            try:
+                # Drop MuPDF's cached resources once a page is done, not between
+                # figures on the same page, which would re-decode its images and fonts
+                if rendered_page is not None and page_num != rendered_page:
+                    fitz.TOOLS.store_shrink(100)
+                rendered_page = page_num
+                page = pages[page_num]
+                clip_rect = fitz.Rect(clip_x0[i], clip_y0[i], clip_x1[i], clip_y1[i])
+
+                log.debug("  Figure %d on page %d: (%.1f, %.1f, %.1f, %.1f)",
+                          idx + 1, page_num, x0[i], y0[i], x1[i], y1[i])
 
                 # Render the clipped region at high resolution
                 mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better quality
                 pix = page.get_pixmap(matrix=mat, clip=clip_rect)
 
+                # Verify the image size from the pixmap before writing anything
+                width, height = pix.width, pix.height
+                if width < 30 or height < 30:
+                    log.debug("    Skipping: image too small (%dx%d)", width, height)
+                    continue
+
                 # Save the image
                 img_filename = f"figure_{page_num}_{idx + 1}.png"
                 img_path = self.images_dir / img_filename
-                pix.save(str(img_path))
-
-                # Verify the image
-                with Image.open(img_path) as img:
-                    width, height = img.size
-                    if width < 30 or height < 30:
-                        print(f"    Skipping: image too small ({width}x{height})")
-                        os.remove(img_path)
-                        continue
+                # Fast zlib level: encoding dominates per-figure cost and the
+                # files are only served for display
+                pix.pil_save(str(img_path), format="PNG", compress_level=1)
+                # Release the pixmap buffer now rather than at the next render
+                pix = None
 
-                print(f"    Saved: {img_filename} ({width}x{height})")
+                log.debug("    Saved: %s (%dx%d)", img_filename, width, height)
                 figures.append({
                     "page": page_num,
                     "index": idx + 1,
@@ -166,22 +476,24 @@ class PDFToMarkdownConverter:
                     "path": str(img_path),
                     "type": "detected_figure",
                     "dimensions": (width, height),
-                    "bbox": {"x0": x0, "y0": y0, "x1": x1, "y1": y1}
+                    "bbox": {
+                        "x0": float(x0[i]), "y0": float(y0[i]),
+                        "x1": float(x1[i]), "y1": float(y1[i])
+                    }
                 })
 
             except Exception as e:
-                print(f"Warning: Could not extract figure {idx + 1}: {e}")
-                import traceback
-                traceback.print_exc()
+                log.warning("Could not extract figure %d: %s", idx + 1, e, exc_info=True)
 
-        doc.close()
+        if rendered_page is not None:
+            fitz.TOOLS.store_shrink(100)
 
         # If Docling didn't detect any figures, fall back to embedded image extraction
         if len(figures) == 0:
-            print("Docling detected no figures, falling back to embedded image extraction...")
+            log.info("Docling detected no figures, falling back to embedded image extraction...")
             return self.extract_figures_pymupdf()
 
-        print(f"Successfully extracted {len(figures)} figures using Docling")
+        log.info("Successfully extracted %d figures using Docling", len(figures))
         self.figures = figures
         return figures
 
@@ -191,8 +503,10 @@ class PDFToMarkdownConverter:
         Used when Docling figure detection doesn't find figures.
         """
         figures = []
-        doc = fitz.open(self.pdf_path)
+        doc = self._get_doc()
         self.total_pages = len(doc)
+        # Images reused across pages (logos, repeated diagrams) are extracted once
+        seen_xrefs = set()
 
         for page_num in range(len(doc)):
             page = doc[page_num]
@@ -201,6 +515,9 @@ class PDFToMarkdownConverter:
             image_list = page.get_images(full=True)
             for img_index, img_info in enumerate(image_list):
                 xref = img_info[0]
+                if xref in seen_xrefs:
+                    continue
+                seen_xrefs.add(xref)
                 try:
                     base_image = doc.extract_image(xref)
                     image_bytes = base_image["image"]
@@ -210,19 +527,17 @@ class PDFToMarkdownConverter:
                     if len(image_bytes) < 1000:
                         continue
 
+                    # Check image dimensions before touching disk
+                    # (reported by PyMuPDF, no decode needed)
+                    width, height = base_image["width"], base_image["height"]
+                    # Skip very small images
+                    if width < 50 or height < 50:
+                        continue
+
                     img_filename = f"page{page_num + 1}_img{img_index + 1}.{image_ext}"
                     img_path = self.images_dir / img_filename
 
-                    with open(img_path, "wb") as img_file:
-                        img_file.write(image_bytes)
-
-                    # Check image dimensions
-                    with Image.open(img_path) as img:
-                        width, height = img.size
-                        # Skip very small images
-                        if width < 50 or height < 50:
-                            os.remove(img_path)
-                            continue
+                    _write_bytes(img_path, image_bytes)
 
                     figures.append({
                         "page": page_num + 1,
@@ -233,26 +548,53 @@ class PDFToMarkdownConverter:
                         "dimensions": (width, height)
                     })
                 except Exception as e:
-                    print(f"Warning: Could not extract image from page {page_num + 1}: {e}")
+                    log.warning("Could not extract image from page %d: %s", page_num + 1, e)
 
-        doc.close()
         self.figures = figures
         return figures
 
-    def convert_with_docling(self) -> Tuple[str, any]:
+    def _needs_ocr(self) -> bool:
+        """
+        Decide whether Docling should OCR this PDF.
+        Checks every page's text layer (get_text is cheap next to OCR); only if
+        all pages already have extractable text is the PDF treated as
+        born-digital and OCR skipped, so mixed PDFs keep OCR for scanned pages.
+        """
+        if not self.use_ocr:
+            return False
+
+        doc = self._get_doc()
+        return any(len(page.get_text("text").strip()) < 100 for page in doc)
+
+    def convert_with_docling(self, result=None) -> Tuple[str, any]:
         """
         Convert PDF to markdown using Docling.
         Returns tuple of (markdown_content, docling_result).
+
+        Args:
+            result: Docling result already produced for this PDF (by convert_many);
+                    when given, the Docling conversion itself is skipped
         """
-        print("Converting with Docling...")
+        if result is None:
+            log.info("Converting with Docling...")
 
-        # Create converter
-        converter = DocumentConverter(
-            allowed_formats=[InputFormat.PDF],
-        )
+            # Skip Docling's OCR stage for born-digital PDFs
+            do_ocr = self._needs_ocr()
+            if self.use_ocr and not do_ocr:
+                log.info("PDF has a text layer, skipping OCR")
 
-        # Convert document
-        result = converter.convert(str(self.pdf_path))
+            # Reuse the cached converter for these options (models are loaded once)
+            converter = _get_docling_converter(do_ocr, self.extract_tables, "fast")
+
+            # Convert document
+            result = converter.convert(str(self.pdf_path))
+        else:
+            from docling.datamodel.base_models import ConversionStatus
+
+            # Batch results are collected without raising, so check them here
+            if result.status not in (ConversionStatus.SUCCESS, ConversionStatus.PARTIAL_SUCCESS):
+                errors = "; ".join(err.error_message for err in result.errors)
+                raise RuntimeError(f"status {result.status.value}: {errors}")
 
         # Export to markdown
         markdown_content = result.document.export_to_markdown()
@@ -271,81 +613,117 @@ class PDFToMarkdownConverter:
     def convert_with_fallback(self) -> str:
         """
         Fallback conversion using PyMuPDF + Tesseract.
+        Pages are processed in parallel across a pool of worker processes.
         """
-        print("Using fallback converter (PyMuPDF + Tesseract)...")
-        import pytesseract
+        log.info("Using fallback converter (PyMuPDF + Tesseract)...")
 
-        doc = fitz.open(self.pdf_path)
+        doc = self._get_doc()
         self.total_pages = len(doc)
 
-        page_contents = []
-
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            print(f"Processing page {page_num + 1}/{len(doc)}...")
+        # One slot per page, filled as results arrive in any order
+        page_texts: List[Optional[str]] = [None] * self.total_pages
+        ocr_pages: List[int] = []
+        completed = 0
 
-            # Try native text extraction first
-            text = page.get_text("text").strip()
-
-            # If very little text found, use OCR
+        # Native text extraction is cheap, so it runs here; only pages with
+        # very little text (scans) are sent to the OCR pool
+        for page_num in range(self.total_pages):
+            text = doc[page_num].get_text("text").strip()
             if len(text) < 100 and self.use_ocr:
-                mat = fitz.Matrix(150/72, 150/72)
-                pix = page.get_pixmap(matrix=mat)
-                img_data = pix.tobytes("png")
-                img = Image.open(BytesIO(img_data))
-                text = pytesseract.image_to_string(img, lang='eng')
-
-            page_contents.append(f"## Page {page_num + 1}\n\n{text}")
-
-        doc.close()
-        return "\n\n---\n\n".join(page_contents)
+                ocr_pages.append(page_num)
+                continue
+            page_texts[page_num] = text
+            completed += 1
+            log.info("Processing page %d/%d...", completed, self.total_pages)
+
+        if ocr_pages:
+            # OCR_CONCURRENCY bounds the number of concurrent Tesseract processes.
+            # Worker processes rather than threads: PyMuPDF is not thread-safe.
+            concurrency = int(os.environ.get("OCR_CONCURRENCY", os.cpu_count() or 1))
+            max_workers = max(1, min(concurrency, len(ocr_pages)))
+
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_ocr_worker,
+                initargs=(str(self.pdf_path),)
+            ) as executor:
+                futures = [executor.submit(_ocr_page, page_num) for page_num in ocr_pages]
+                for future in as_completed(futures):
+                    page_num, text = future.result()
+                    page_texts[page_num] = text
+                    completed += 1
+                    log.info("Processing page %d/%d...", completed, self.total_pages)
+
+        # Slots are already in document order
+        return "\n\n---\n\n".join(
+            f"## Page {page_num + 1}\n\n{text}"
+            for page_num, text in enumerate(page_texts)
+        )
 
-    def convert(self) -> Tuple[str, str]:
+    def convert(self, docling_result=None) -> Tuple[str, str]:
         """
         Main conversion method.
         Uses Docling for text extraction AND figure detection.
         Falls back to PyMuPDF + Tesseract if Docling fails.
 
+        Args:
+            docling_result: Docling result already produced for this PDF (by convert_many)
+
         Returns:
             Tuple of (markdown_text, output_path)
         """
         conversion_method = "Docling"
-        docling_result = None
 
-        # Try Docling first for both text conversion and figure detection
-        if DOCLING_AVAILABLE:
-            try:
-                print("Converting with Docling (text + figure detection)...")
-                markdown_content, docling_result = self.convert_with_docling()
+        try:
+            # Try Docling first for both text conversion and figure detection
+            if DOCLING_AVAILABLE:
+                try:
+                    log.info("Converting with Docling (text + figure detection)...")
+                    markdown_content, docling_result = self.convert_with_docling(docling_result)
 
-                # Extract figures using Docling's layout detection
-                print("Extracting figures using Docling's layout analysis...")
-                self.extract_figures_from_docling(docling_result)
+                    # Extract figures using Docling's layout detection
+                    log.info("Extracting figures using Docling's layout analysis...")
+                    self.extract_figures_from_docling(docling_result)
 
-            except Exception as e:
-                print(f"Docling conversion failed: {e}")
-                print("Falling back to PyMuPDF + Tesseract...")
+                except Exception as e:
+                    log.warning("Docling conversion failed: %s", e)
+                    docling_result = None
+                    log.info("Falling back to PyMuPDF + Tesseract...")
+                    markdown_content = self.convert_with_fallback()
+                    conversion_method = "PyMuPDF + Tesseract OCR"
+
+                    # Fall back to PyMuPDF for figure extraction
+                    log.info("Extracting figures using PyMuPDF...")
+                    self.extract_figures_pymupdf()
+            else:
                 markdown_content = self.convert_with_fallback()
                 conversion_method = "PyMuPDF + Tesseract OCR"
 
-                # Fall back to PyMuPDF for figure extraction
-                print("Extracting figures using PyMuPDF...")
+                # Use PyMuPDF for figure extraction
+                log.info("Extracting figures using PyMuPDF...")
                 self.extract_figures_pymupdf()
-        else:
-            markdown_content = self.convert_with_fallback()
-            conversion_method = "PyMuPDF + Tesseract OCR"
+        finally:
+            # Release the shared PDF handle once extraction is done
+            self._close_doc()
 
-            # Use PyMuPDF for figure extraction
-            print("Extracting figures using PyMuPDF...")
-            self.extract_figures_pymupdf()
+        return self._finalize(markdown_content, conversion_method, docling_result)
 
+    def _finalize(self, markdown_content: str, conversion_method: str,
+                  docling_result=None) -> Tuple[str, str]:
+        """
+        Post-process extracted text and figures: link figures to questions,
+        format the markdown, and write the markdown and metadata files.
+
+        Returns:
+            Tuple of (markdown_text, output_path)
+        """
         # Count meaningful figures
         meaningful_figures = [f for f in self.figures if f.get('type') in ('detected_figure', 'embedded_image')]
-        print(f"Extracted {len(meaningful_figures)} figures")
-        print(f"Converting {self.total_pages} pages with {conversion_method}...")
+        log.info("Extracted %d figures", len(meaningful_figures))
+        log.info("Converting %d pages with %s...", self.total_pages, conversion_method)
 
         # Link figures to questions
-        self.link_figures_to_questions(markdown_content)
+        self.link_figures_to_questions(markdown_content, docling_result)
 
         # Format the markdown
         formatted_text = self.format_markdown(markdown_content)
@@ -362,16 +740,16 @@ class PDFToMarkdownConverter:
 
 """
 
-        # Combine all parts
-        final_markdown = header + formatted_text
-
-        # Add figure appendix
-        final_markdown += self.create_figure_appendix()
+        # Create figure appendix
+        appendix = self.create_figure_appendix()
 
-        # Save markdown file
+        # Save markdown file, writing each part directly rather than
+        # building the concatenated document first
         output_path = self.output_dir / f"{self.pdf_path.stem}.md"
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(final_markdown)
+        with open(output_path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(header)
+            f.write(formatted_text)
+            f.write(appendix)
 
         # Save figure metadata as JSON
         metadata = {
@@ -382,59 +760,219 @@ class PDFToMarkdownConverter:
                 {k: v for k, v in fig.items() if k != 'path'}
                 for fig in self.figures if fig.get('type') in ('detected_figure', 'embedded_image')
             ],
-            "question_figure_map": {str(k): v for k, v in self.question_figure_map.items()}
+            # Integer question numbers become string keys in both encoders
+            "question_figure_map": self.question_figure_map
         }
 
         metadata_path = self.output_dir / f"{self.pdf_path.stem}_metadata.json"
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(metadata_path, "wb") as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(metadata_path, "w", encoding="utf-8") as f:
+                json.dump(metadata, f, indent=2)
 
-        print(f"\nConversion complete!")
-        print(f"Markdown saved to: {output_path}")
-        print(f"Metadata saved to: {metadata_path}")
-        print(f"Images saved to: {self.images_dir}")
+        log.info("\nConversion complete!")
+        log.info("Markdown saved to: %s", output_path)
+        log.info("Metadata saved to: %s", metadata_path)
+        log.info("Images saved to: %s", self.images_dir)
 
-        return final_markdown, str(output_path)
+        return "".join((header, formatted_text, appendix)), str(output_path)
 
-    def link_figures_to_questions(self, markdown_text: str) -> Dict[int, List[str]]:
+    @classmethod
+    def convert_many(cls, pdf_paths: List[str], output_dir: str = "output", use_ocr: bool = True,
+                     extract_tables: bool = True) -> List[Tuple[str, str]]:
         """
-        Analyze markdown text to link figures with their corresponding questions.
+        Convert several PDFs, running Docling over the whole batch in a single
+        convert_all() call so models stay loaded between documents.
+        Each PDF is written to its own subdirectory of output_dir, named after
+        its stem (with a numeric suffix for repeated stems), so outputs and
+        figure filenames don't collide. Documents Docling fails on fall back to
+        PyMuPDF + Tesseract individually.
+
+        Returns:
+            List of (markdown_text, output_path) tuples, in input order
         """
-        question_figure_map = {}
+        # One subdirectory per PDF; repeated stems (a/test.pdf, b/test.pdf)
+        # get a numeric suffix so no output overwrites another
+        instances = []
+        used_dirs = set()
+        for pdf_path in pdf_paths:
+            stem = Path(pdf_path).stem
+            dir_name = stem
+            suffix = 2
+            while dir_name in used_dirs:
+                dir_name = f"{stem}_{suffix}"
+                suffix += 1
+            used_dirs.add(dir_name)
+            instances.append(cls(pdf_path, str(Path(output_dir) / dir_name), use_ocr, extract_tables))
+        if not DOCLING_AVAILABLE:
+            return [inst.convert() for inst in instances]
+
+        # One converter serves the whole batch, so OCR is on if any PDF needs it
+        do_ocr = False
+        for inst in instances:
+            do_ocr = do_ocr or inst._needs_ocr()
+            inst._close_doc()
+
+        log.info("Converting %d PDFs with Docling...", len(instances))
+        try:
+            # Docling is imported and its models loaded here
+            converter = _get_docling_converter(do_ocr, extract_tables, "fast")
+            # convert_all yields one result per input, in input order
+            results = iter(converter.convert_all(
+                [str(inst.pdf_path) for inst in instances],
+                raises_on_error=False
+            ))
+        except Exception as e:
+            # Broken install or converter build: every PDF takes the per-file path
+            log.warning("Docling batch conversion failed: %s", e)
+            results = iter(())
+
+        outputs = []
+        for inst in instances:
+            try:
+                result = next(results, None)
+            except Exception as e:
+                # Pipeline-level errors still raise; convert the remaining
+                # PDFs one at a time instead
+                log.warning("Docling batch conversion failed: %s", e)
+                results = iter(())
+                result = None
+            outputs.append(inst.convert(docling_result=result))
+
+        return outputs
 
-        figure_keywords = [
-            'figure', 'graph', 'diagram', 'shown', 'below', 'above',
-            'image', 'chart', 'table', 'illustration', 'picture',
-            'as shown', 'in the figure', 'following figure', 'refer to',
-            'based on', 'according to'
-        ]
+    def _questions_from_docling(self, docling_result) -> List[Tuple[int, int, str]]:
+        """
+        Recover numbered questions from Docling's document tree.
+        Each text item starting with a question number (or list item with a
+        numeric marker) opens a question on its provenance page; the text of
+        following items is accumulated into it until the next question.
 
-        # Pattern to find question numbers
-        question_pattern = r'(?:^|\n)\s*\*?\*?(\d+)\.\*?\*?\s+(.+?)(?=\n\s*\*?\*?\d+\.\*?\*?|$)'
+        Returns:
+            List of (question_number, page_number, question_text)
+        """
+        from docling_core.types.doc import ListItem, TextItem
 
-        questions = list(re.finditer(question_pattern, markdown_text, re.DOTALL))
+        questions: List[Tuple[int, int, str]] = []
+        q_num = None
+        q_page = 1
+        q_parts: List[str] = []
 
-        current_page = 1
-        for match in questions:
-            q_num = int(match.group(1))
-            q_text = match.group(2).lower()
+        for item, level in docling_result.document.iterate_items():
+            if not isinstance(item, TextItem):
+                continue
 
+            number = None
+            body = item.text
+            if isinstance(item, ListItem):
+                marker = _RE_LIST_MARKER.match(item.marker or "")
+                if marker:
+                    number = int(marker.group(1))
+            if number is None:
+                match = _RE_ITEM_QUESTION.match(body)
+                if match:
+                    number, body = int(match.group(1)), match.group(2)
+
+            if number is None:
+                # Continuation of the current question (passages, answer choices)
+                if q_num is not None:
+                    q_parts.append(body)
+                continue
+
+            if q_num is not None:
+                questions.append((q_num, q_page, "\n".join(q_parts)))
+            q_num = number
+            if item.prov:
+                q_page = item.prov[0].page_no
+            q_parts = [body]
+
+        if q_num is not None:
+            questions.append((q_num, q_page, "\n".join(q_parts)))
+
+        return questions
+
+    def _questions_from_markdown(self, markdown_text: str) -> List[Tuple[int, int, str]]:
+        """
+        Recover numbered questions by scanning markdown text, taking each
+        question's page from the last page marker before it.
+
+        Returns:
+            List of (question_number, page_number, question_text)
+        """
+        questions: List[Tuple[int, int, str]] = []
+
+        # Page markers in document order; questions are walked in order too,
+        # so a single cursor tracks the last marker before each question
+        page_marks = [(m.end(), int(m.group(1))) for m in _RE_PAGE.finditer(markdown_text)]
+        mark_idx = 0
+
+        current_page = 1
+        for match in _RE_QUESTION.finditer(markdown_text):
             # Find which page this question is on
             pos = match.start()
-            page_matches = list(re.finditer(r'(?:## Page|page\s+)(\d+)', markdown_text[:pos], re.IGNORECASE))
-            if page_matches:
-                current_page = int(page_matches[-1].group(1))
+            while mark_idx < len(page_marks) and page_marks[mark_idx][0] <= pos:
+                current_page = page_marks[mark_idx][1]
+                mark_idx += 1
+
+            questions.append((int(match.group(1)), current_page, match.group(2)))
+
+        return questions
 
+    def _figures_by_page(self) -> Dict[int, List[Tuple[int, Dict]]]:
+        """
+        Index linkable figures (detected figures and embedded images) by page.
+        Entries are (position in self.figures, figure) so callers can keep
+        extraction order when merging several pages.
+        """
+        figures_by_page: Dict[int, List[Tuple[int, Dict]]] = defaultdict(list)
+        for position, fig in enumerate(self.figures):
+            if fig.get('type') in ('detected_figure', 'embedded_image'):
+                figures_by_page[fig['page']].append((position, fig))
+        return figures_by_page
+
+    def link_figures_to_questions(self, markdown_text: str, docling_result=None) -> Dict[int, List[str]]:
+        """
+        Analyze the document to link figures with their corresponding questions.
+        Uses Docling's document structure when available for authoritative page
+        numbers, falling back to scanning the markdown text.
+        """
+        question_figure_map: Dict[int, List[str]] = {}
+        # Filenames already linked per question, for O(1) duplicate checks
+        linked_filenames: Dict[int, set] = {}
+
+        # Each question only looks at the pages in its window; skip question
+        # detection entirely when there are no linkable figures
+        page_to_figs = self._figures_by_page()
+        if not page_to_figs:
+            self.question_figure_map = question_figure_map
+            return question_figure_map
+
+        questions = []
+        if docling_result is not None:
+            try:
+                questions = self._questions_from_docling(docling_result)
+            except Exception as e:
+                log.warning("Could not read questions from Docling structure: %s", e)
+        if not questions:
+            questions = self._questions_from_markdown(markdown_text)
+
+        for q_num, current_page, q_text in questions:
             # Check if question references a figure
-            if any(keyword in q_text for keyword in figure_keywords):
-                for fig in self.figures:
-                    if fig.get('type') in ('detected_figure', 'embedded_image'):
-                        fig_page = fig['page']
-                        if abs(fig_page - current_page) <= 2:
-                            if q_num not in question_figure_map:
-                                question_figure_map[q_num] = []
-                            if fig['filename'] not in question_figure_map[q_num]:
-                                question_figure_map[q_num].append(fig['filename'])
+            if _RE_FIGURE_KEYWORD.search(q_text):
+                # Figures within 2 pages, kept in extraction order
+                nearby = sorted(
+                    entry
+                    for fig_page in range(current_page - 2, current_page + 3)
+                    for entry in page_to_figs.get(fig_page, ())
+                )
+                for _, fig in nearby:
+                    filename = fig['filename']
+                    seen = linked_filenames.setdefault(q_num, set())
+                    if filename not in seen:
+                        seen.add(filename)
+                        question_figure_map.setdefault(q_num, []).append(filename)
 
         self.question_figure_map = question_figure_map
         return question_figure_map
@@ -445,22 +983,36 @@ class PDFToMarkdownConverter:
         """
         text = raw_text
 
-        # Clean up common artifacts
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r'[ \t]+', ' ', text)
-        text = re.sub(r'(\n\s*)+\n', '\n\n', text)
-
-        # Format question numbers (bold)
-        text = re.sub(r'^(\d+)\.\s+', r'**\1.** ', text, flags=re.MULTILINE)
-
-        # Format answer choices as list items
-        text = re.sub(r'^([A-J])\.\s+', r'- **\1.** ', text, flags=re.MULTILINE)
-        text = re.sub(r'^([A-J])\s+', r'- **\1.** ', text, flags=re.MULTILINE)
-
-        # Format section headers
-        text = re.sub(r'^(PASSAGE\s+[IVX]+)', r'### \1', text, flags=re.MULTILINE)
-        text = re.sub(r'^(ENGLISH TEST|MATHEMATICS TEST|READING TEST|SCIENCE TEST)',
-                     r'# \1', text, flags=re.MULTILINE)
+        # Clean up common artifacts (runs of 3+ newlines are collapsed by
+        # the blank-line pass, so no separate pass is needed for them)
+        text = _RE_HSPACE.sub(' ', text)
+        text = _RE_BLANK_LINES.sub('\n\n', text)
+
+        # Format question numbers (bold), answer choices (list items) and
+        # section headers in a single scan. Rules are ranked in the order they
+        # used to run as separate passes: a rule's trailing whitespace can
+        # swallow the newline before the next line, hiding that line from
+        # lower-ranked rules but not from equal or higher-ranked ones.
+        last_end, last_rank = -1, -1
+
+        def format_line_start(match):
+            nonlocal last_end, last_rank
+            if match.group('question') is not None:
+                rank, replacement = 0, f"**{match.group('question')}.** "
+            elif match.group('choice') is not None:
+                rank = 1 if match.group('dot') else 2
+                replacement = f"- **{match.group('choice')}.** "
+            elif match.group('passage') is not None:
+                rank, replacement = 3, f"### {match.group('passage')}"
+            else:
+                rank, replacement = 4, f"# {match.group('section')}"
+
+            if match.start() == last_end and rank > last_rank:
+                return match.group(0)
+            last_end, last_rank = match.end(), rank
+            return replacement
+
+        text = _RE_LINE_START.sub(format_line_start, text)
 
         return text
 
@@ -471,28 +1023,27 @@ class PDFToMarkdownConverter:
         if not self.figures:
             return ""
 
-        appendix = "\n\n---\n\n## Extracted Figures\n\n"
+        # Collect pieces and join once instead of growing a string
+        parts = ["\n\n---\n\n## Extracted Figures\n\n"]
 
-        figures_by_page = {}
-        for fig in self.figures:
-            if fig.get('type') not in ('detected_figure', 'embedded_image'):
-                continue
-            page = fig['page']
-            if page not in figures_by_page:
-                figures_by_page[page] = []
-            figures_by_page[page].append(fig)
+        figures_by_page = self._figures_by_page()
+
+        # First question each figure is linked to
+        fig_to_question: Dict[str, int] = {}
+        for q_num, fig_names in self.question_figure_map.items():
+            for fig_name in fig_names:
+                fig_to_question.setdefault(fig_name, q_num)
 
         for page in sorted(figures_by_page.keys()):
-            appendix += f"### Page {page}\n\n"
-            for fig in figures_by_page[page]:
-                appendix += f"![Figure from page {page}](images/{fig['filename']})\n\n"
+            parts.append(f"### Page {page}\n\n")
+            for _, fig in figures_by_page[page]:
+                parts.append(f"![Figure from page {page}](images/{fig['filename']})\n\n")
 
-                for q_num, fig_names in self.question_figure_map.items():
-                    if fig['filename'] in fig_names:
-                        appendix += f"*Linked to Question {q_num}*\n\n"
-                        break
+                q_num = fig_to_question.get(fig['filename'])
+                if q_num is not None:
+                    parts.append(f"*Linked to Question {q_num}*\n\n")
 
-        return appendix
+        return "".join(parts)
 
 
 def main():
@@ -501,8 +1052,10 @@ def main():
         description="Convert PDFs to Markdown using Docling"
     )
     parser.add_argument(
-        "pdf_path",
-        help="Path to the input PDF file"
+        "pdf_paths",
+        nargs="+",
+        metavar="pdf_path",
+        help="Path to the input PDF file (several PDFs are converted as one batch)"
     )
     parser.add_argument(
         "-o", "--output",
@@ -520,17 +1073,45 @@ def main():
         action="store_true",
         help="Disable OCR (for non-scanned PDFs)"
     )
+    parser.add_argument(
+        "--no-tables",
+        action="store_true",
+        help="Disable table structure recognition (faster)"
+    )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Log per-figure details"
+    )
 
     args = parser.parse_args()
 
-    if not os.path.exists(args.pdf_path):
-        print(f"Error: File not found: {args.pdf_path}")
-        sys.exit(1)
+    # Progress goes to stdout as plain lines; the Node server parses them.
+    # Only this module's logger is configured so Docling's own INFO logs stay quiet.
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    log.addHandler(handler)
+    log.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+
+    for pdf_path in args.pdf_paths:
+        if not os.path.exists(pdf_path):
+            log.error("Error: File not found: %s", pdf_path)
+            sys.exit(1)
+
+    if len(args.pdf_paths) > 1:
+        PDFToMarkdownConverter.convert_many(
+            args.pdf_paths,
+            output_dir=args.output,
+            use_ocr=not args.no_ocr,
+            extract_tables=not args.no_tables
+        )
+        return 0
 
     converter = PDFToMarkdownConverter(
-        pdf_path=args.pdf_path,
+        pdf_path=args.pdf_paths[0],
         output_dir=args.output,
-        use_ocr=not args.no_ocr
+        use_ocr=not args.no_ocr,
+        extract_tables=not args.no_tables
     )
 
     markdown_text, output_path = converter.convert()